@@ -1,29 +1,28 @@
-import argparse
-import hashlib
 import sys
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple, Union
 import os
 import stat
-import pwd
-import grp
-import mimetypes
 
-@dataclass
+# argparse, hashlib, mimetypes, pwd, grp and concurrent.futures are imported
+# where they are used, so importing this module as a library stays cheap.
+
+@dataclass(slots=True, frozen=True)
 class FileMeta:
-    """Holds metadata for a single file."""
+    """Holds metadata for a single file. Timestamps are raw epoch seconds."""
     full_path: Path
     name: str
     stem: str
     suffix: str
-    suffixes: List[str]
+    suffixes: Tuple[str, ...]
     parent: Path
     size_bytes: int
-    created: datetime
-    modified: datetime
-    accessed: datetime
+    created: float
+    modified: float
+    accessed: float
     mode: int
     permissions: str
     n_links: int
@@ -36,101 +35,496 @@ class FileMeta:
     is_symlink: bool
     mime_type: Optional[str] = None
     sha1_hash: Optional[str] = None
+    hash_algo: Optional[str] = None
+    hash_value: Optional[str] = None
+
+# oct() of every permission-bit value, so collection only does a lookup.
+_PERMISSIONS = tuple(oct(bits) for bits in range(0o1000))
+
+# Read size for hashing. Each chunk is read into one reused buffer, so
+# larger chunks mean fewer Python-level iterations without new allocations.
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Digest algorithms offered by the CLI. blake3 needs the optional
+# `blake3` package; the others come from hashlib (OpenSSL EVP).
+HASH_ALGORITHMS = ("sha1", "sha256", "blake3")
+
+def _new_hasher(algo: str):
+    """Return a fresh hash object for the named algorithm."""
+    if algo == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError:
+            raise ImportError(
+                "The blake3 algorithm requires the 'blake3' package."
+            ) from None
+        # Multithreaded hashing for large inputs.
+        return blake3(max_threads=blake3.AUTO)
+
+    import hashlib
+    return hashlib.new(algo)
+
+def compute_digest(path: Path, algo: str = "sha1") -> str:
+    """
+    Compute the hex digest of a file.
+
+    SHA algorithms are computed by OpenSSL through hashlib, which uses
+    SHA-NI when the linked libcrypto supports it (OpenSSL >= 1.0.2 on
+    capable CPUs). blake3 uses the SIMD, multithreaded `blake3` package.
+
+    Args:
+        path (Path): File to hash.
+        algo (str, optional): One of HASH_ALGORITHMS ("sha1", "sha256",
+            "blake3"). Defaults to "sha1".
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    # Unbuffered: readinto() fills our HASH_CHUNK_SIZE buffer directly.
+    with path.open("rb", buffering=0) as f:
+        hasher = _new_hasher(algo)
+        buf = bytearray(HASH_CHUNK_SIZE)
+        mv = memoryview(buf)
+        while n := f.readinto(buf):
+            hasher.update(mv[:n])
+    return hasher.hexdigest()
 
 def compute_sha1(path: Path) -> str:
     """Compute SHA1 hash of a file."""
-    sha1 = hashlib.sha1()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha1.update(chunk)
-    return sha1.hexdigest()
+    return compute_digest(path, "sha1")
+
+# Common suffixes resolved without initialising the mimetypes database.
+# Only suffixes where Python's built-in table and the usual system
+# mime.types files agree are listed, so the result does not depend on
+# whether the lookup hit this table or fell back to mimetypes.
+_MIME = {
+    ".txt": "text/plain",
+    ".csv": "text/csv",
+    ".tsv": "text/tab-separated-values",
+    ".json": "application/json",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".css": "text/css",
+    ".py": "text/x-python",
+    ".pdf": "application/pdf",
+    ".zip": "application/zip",
+    ".tar": "application/x-tar",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+    ".svg": "image/svg+xml",
+    ".ico": "image/vnd.microsoft.icon",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/x-wav",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+    ".avi": "video/x-msvideo",
+    ".mov": "video/quicktime",
+    ".doc": "application/msword",
+    ".xls": "application/vnd.ms-excel",
+    ".ppt": "application/vnd.ms-powerpoint",
+    ".bin": "application/octet-stream",
+}
+
+def _guess_mime_type(name: str, suffix: str) -> Optional[str]:
+    """Guess a MIME type from the file suffix, falling back to mimetypes."""
+    mime_type = _MIME.get(suffix.lower())
+    if mime_type is None and suffix:
+        # Handles rarer types and compound suffixes such as .tar.gz.
+        import mimetypes
+        mime_type, _ = mimetypes.guess_type(name)
+    return mime_type
+
+def _split_name(name: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    Split a file name into (stem, suffix, suffixes) with the same rules as
+    pathlib.PurePath, without re-parsing the path for each property.
+    """
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        stem, suffix = name[:i], name[i:]
+    else:
+        stem, suffix = name, ""
+    if name.endswith("."):
+        suffixes = ()
+    else:
+        suffixes = tuple("." + s for s in name.lstrip(".").split(".")[1:])
+    return stem, suffix, suffixes
+
+@lru_cache(maxsize=1024)
+def _uid_to_name(uid: int) -> Optional[str]:
+    """Return the user name for a UID, or None if it has no passwd entry."""
+    try:
+        import pwd
+    except ImportError:  # Not available on Windows
+        return None
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return None
 
-def get_file_metadata(path: Path, compute_hash: bool = False) -> FileMeta:
+@lru_cache(maxsize=1024)
+def _gid_to_name(gid: int) -> Optional[str]:
+    """Return the group name for a GID, or None if it has no group entry."""
+    try:
+        import grp
+    except ImportError:  # Not available on Windows
+        return None
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return None
+
+def get_file_metadata(
+    path: Union[Path, os.DirEntry],
+    compute_hash: bool = False,
+    hash_algo: str = "sha1",
+    resolve: bool = False,
+) -> FileMeta:
     """
     Collect all available metadata for a file into a FileMeta object.
 
     Args:
-        path (Path): Path to the file.
-        compute_hash (bool, optional): Whether to compute SHA1 hash. Defaults to False.
+        path (Path | os.DirEntry): Path to the file, or an entry yielded by
+            os.scandir() whose cached stat result is reused.
+        compute_hash (bool, optional): Whether to compute a file hash. Only
+            regular files are hashed. Defaults to False.
+        hash_algo (str, optional): Digest algorithm, see compute_digest().
+            Defaults to "sha1".
+        resolve (bool, optional): Resolve symlinks in full_path. Otherwise
+            full_path is only made absolute. Defaults to False.
 
     Returns:
         FileMeta: Object containing all file metadata.
     """
-    stat_info = path.stat()
+    # A single lstat gives us every type flag; only symlinks need a second
+    # stat to describe their target. Dangling links keep the lstat result.
+    if isinstance(path, os.DirEntry):
+        stat_info = path.stat(follow_symlinks=False)
+        is_symlink = stat.S_ISLNK(stat_info.st_mode)
+        if is_symlink:
+            try:
+                stat_info = path.stat()
+            except OSError:
+                pass
+        path = Path(path.path)
+    else:
+        stat_info = os.lstat(path)
+        is_symlink = stat.S_ISLNK(stat_info.st_mode)
+        if is_symlink:
+            try:
+                stat_info = os.stat(path)
+            except OSError:
+                pass
     
-    # Owner and group names (Unix)
-    try:
-        owner_name = pwd.getpwuid(stat_info.st_uid).pw_name
-    except KeyError:
-        owner_name = None
-    try:
-        group_name = grp.getgrgid(stat_info.st_gid).gr_name
-    except KeyError:
-        group_name = None
+    # Owner and group names (Unix), cached since scans see few distinct owners
+    owner_name = _uid_to_name(stat_info.st_uid)
+    group_name = _gid_to_name(stat_info.st_gid)
     
-    mime_type, _ = mimetypes.guess_type(str(path))
+    path_str = os.fspath(path)
+    name = os.path.basename(path_str)
+    stem, suffix, suffixes = _split_name(name)
+
+    mime_type = _guess_mime_type(name, suffix)
     
-    sha1 = None
-    if compute_hash:
+    digest = None
+    if compute_hash and stat.S_ISREG(stat_info.st_mode):
         try:
-            sha1 = compute_sha1(path)
+            digest = compute_digest(path, hash_algo)
         except PermissionError:
-            sha1 = "(access denied)"
+            digest = "(access denied)"
+        except OSError:
+            # e.g. removed between the lstat above and open()
+            digest = "(read error)"
 
     return FileMeta(
-        full_path=path.resolve(),
-        name=path.name,
-        stem=path.stem,
-        suffix=path.suffix,
-        suffixes=path.suffixes,
-        parent=path.parent,
+        full_path=Path(
+            os.path.realpath(path_str) if resolve else os.path.abspath(path_str)
+        ),
+        name=name,
+        stem=stem,
+        suffix=suffix,
+        suffixes=suffixes,
+        parent=Path(os.path.dirname(path_str)),
         size_bytes=stat_info.st_size,
-        created=datetime.fromtimestamp(stat_info.st_ctime),
-        modified=datetime.fromtimestamp(stat_info.st_mtime),
-        accessed=datetime.fromtimestamp(stat_info.st_atime),
+        created=stat_info.st_ctime,
+        modified=stat_info.st_mtime,
+        accessed=stat_info.st_atime,
         mode=stat_info.st_mode,
-        permissions=oct(stat_info.st_mode & 0o777),
+        permissions=_PERMISSIONS[stat_info.st_mode & 0o777],
         n_links=stat_info.st_nlink,
         owner_uid=stat_info.st_uid,
         owner_name=owner_name,
         group_gid=stat_info.st_gid,
         group_name=group_name,
-        is_file=path.is_file(),
-        is_dir=path.is_dir(),
-        is_symlink=path.is_symlink(),
+        is_file=stat.S_ISREG(stat_info.st_mode),
+        is_dir=stat.S_ISDIR(stat_info.st_mode),
+        is_symlink=is_symlink,
         mime_type=mime_type,
-        sha1_hash=sha1
+        sha1_hash=digest if hash_algo == "sha1" else None,
+        hash_algo=hash_algo if digest is not None else None,
+        hash_value=digest
     )
 
+# Below this many paths, thread startup costs more than it saves.
+PARALLEL_THRESHOLD = 4
+
+def _try_get_file_metadata(
+    path: Union[Path, os.DirEntry],
+    compute_hash: bool,
+    hash_algo: str,
+    resolve: bool,
+) -> Optional[FileMeta]:
+    """get_file_metadata() for batch callers: None if the entry can't be stat-ed."""
+    try:
+        return get_file_metadata(
+            path, compute_hash=compute_hash, hash_algo=hash_algo, resolve=resolve
+        )
+    except OSError:
+        return None
+
+def get_many_metadata(
+    paths: Iterable[Union[Path, os.DirEntry]],
+    compute_hash: bool = False,
+    hash_algo: str = "sha1",
+    resolve: bool = False,
+    workers: Optional[int] = None,
+) -> List[FileMeta]:
+    """
+    Collect metadata for many files, overlapping their I/O on a thread pool.
+
+    stat() and hashlib release the GIL, so threads make progress on
+    different files concurrently. Paths that cannot be stat-ed (for example
+    removed since they were listed) are skipped rather than aborting the
+    batch.
+
+    Args:
+        paths (Iterable[Path | os.DirEntry]): Files to inspect.
+        compute_hash (bool, optional): Whether to compute hashes of regular files.
+        hash_algo (str, optional): Digest algorithm, see compute_digest().
+        resolve (bool, optional): Resolve symlinks in full_path.
+        workers (int, optional): Maximum number of worker threads. None uses
+            ThreadPoolExecutor's default; 1 or less runs serially.
+
+    Returns:
+        List[FileMeta]: Metadata for each readable path, in input order.
+    """
+    paths = list(paths)
+    if len(paths) <= PARALLEL_THRESHOLD or (workers is not None and workers <= 1):
+        results = [
+            _try_get_file_metadata(p, compute_hash, hash_algo, resolve)
+            for p in paths
+        ]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                lambda p: _try_get_file_metadata(
+                    p, compute_hash, hash_algo, resolve
+                ),
+                paths
+            ))
+    return [meta for meta in results if meta is not None]
+
+async def get_file_metadata_async(
+    path: Union[Path, os.DirEntry],
+    compute_hash: bool = False,
+    hash_algo: str = "sha1",
+    resolve: bool = False,
+) -> FileMeta:
+    """
+    Awaitable get_file_metadata(); the blocking stat/hash work runs in a
+    worker thread so the event loop keeps serving other tasks.
+
+    Args:
+        path (Path | os.DirEntry): Path to the file.
+        compute_hash (bool, optional): Whether to compute a file hash.
+        hash_algo (str, optional): Digest algorithm, see compute_digest().
+        resolve (bool, optional): Resolve symlinks in full_path.
+
+    Returns:
+        FileMeta: Object containing all file metadata.
+    """
+    import asyncio
+
+    return await asyncio.to_thread(
+        get_file_metadata,
+        path,
+        compute_hash=compute_hash,
+        hash_algo=hash_algo,
+        resolve=resolve
+    )
+
+async def get_many_metadata_async(
+    paths: Iterable[Union[Path, os.DirEntry]],
+    compute_hash: bool = False,
+    hash_algo: str = "sha1",
+    resolve: bool = False,
+    max_in_flight: int = 64,
+) -> List[FileMeta]:
+    """
+    Collect metadata for many files from async code, keeping up to
+    max_in_flight stat/hash requests outstanding to hide storage latency.
+
+    The blocking work runs on a dedicated pool of max_in_flight threads, fed
+    by the same number of worker coroutines that pull paths lazily, so
+    neither the loop's default executor nor the number of paths limits
+    concurrency or memory. As with get_many_metadata(), paths that cannot
+    be stat-ed are skipped.
+
+    Args:
+        paths (Iterable[Path | os.DirEntry]): Files to inspect.
+        compute_hash (bool, optional): Whether to compute hashes of regular files.
+        hash_algo (str, optional): Digest algorithm, see compute_digest().
+        resolve (bool, optional): Resolve symlinks in full_path.
+        max_in_flight (int, optional): Maximum number of concurrent requests.
+
+    Returns:
+        List[FileMeta]: Metadata for each readable path, in input order.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    pending = enumerate(paths)
+    results: Dict[int, Optional[FileMeta]] = {}
+
+    def collect(path: Union[Path, os.DirEntry]) -> Optional[FileMeta]:
+        return _try_get_file_metadata(path, compute_hash, hash_algo, resolve)
+
+    async def worker() -> None:
+        # Workers share one iterator; only one coroutine runs at a time.
+        for index, path in pending:
+            results[index] = await loop.run_in_executor(pool, collect, path)
+
+    pool = ThreadPoolExecutor(max_workers=max_in_flight)
+    workers = [asyncio.ensure_future(worker()) for _ in range(max_in_flight)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    ordered = (results[index] for index in range(len(results)))
+    return [meta for meta in ordered if meta is not None]
+
+def scan_directory(
+    directory: Path,
+    compute_hash: bool = False,
+    hash_algo: str = "sha1",
+    resolve: bool = False,
+    recursive: bool = False,
+    workers: Optional[int] = None,
+) -> List[FileMeta]:
+    """
+    Collect metadata for every entry inside a directory.
+
+    Uses os.scandir() so the stat result cached on each entry is reused
+    instead of stat-ing the path again. Entries are then processed with
+    get_many_metadata(). An OSError is raised only if `directory` itself
+    cannot be listed; unreadable subdirectories and entries that vanish
+    mid-scan are skipped.
+
+    Args:
+        directory (Path): Directory to scan.
+        compute_hash (bool, optional): Whether to compute hashes of regular files.
+        hash_algo (str, optional): Digest algorithm, see compute_digest().
+        resolve (bool, optional): Resolve symlinks in full_path.
+        recursive (bool, optional): Descend into subdirectories (symlinks are not followed).
+        workers (int, optional): Maximum number of worker threads. None uses
+            ThreadPoolExecutor's default; 1 or less runs serially.
+
+    Returns:
+        List[FileMeta]: Metadata for each readable entry.
+    """
+    entries: List[os.DirEntry] = []
+    with os.scandir(directory) as it:
+        top = list(it)
+    pending = [top]
+    while pending:
+        for entry in pending.pop():
+            entries.append(entry)
+            if recursive and entry.is_dir(follow_symlinks=False):
+                try:
+                    with os.scandir(entry.path) as it:
+                        pending.append(list(it))
+                except OSError:
+                    continue
+    return get_many_metadata(
+        entries,
+        compute_hash=compute_hash,
+        hash_algo=hash_algo,
+        resolve=resolve,
+        workers=workers
+    )
+
+_METADATA_FMT = (
+    "\n=== FILE METADATA ===\n"
+    "Full Path:         %s\n"
+    "Name:              %s\n"
+    "Stem:              %s\n"
+    "Extension:         %s\n"
+    "All Extensions:    %s\n"
+    "Parent Directory:  %s\n"
+    "Size (bytes):      %d\n"
+    "Created:           %s\n"
+    "Last Modified:     %s\n"
+    "Last Accessed:     %s\n"
+    "Mode:              %d (%s)\n"
+    "Number of Links:   %d\n"
+    "Owner UID/Name:    %d / %s\n"
+    "Group GID/Name:    %d / %s\n"
+    "Is File:           %s\n"
+    "Is Directory:      %s\n"
+    "Is Symlink:        %s\n"
+    "MIME Type:         %s\n"
+)
+
 def print_file_metadata(meta: FileMeta) -> None:
     """Print all metadata stored in a FileMeta object."""
-    print("\n=== FILE METADATA ===")
-    print(f"Full Path:         {meta.full_path}")
-    print(f"Name:              {meta.name}")
-    print(f"Stem:              {meta.stem}")
-    print(f"Extension:         {meta.suffix}")
-    print(f"All Extensions:    {meta.suffixes}")
-    print(f"Parent Directory:  {meta.parent}")
-    print(f"Size (bytes):      {meta.size_bytes}")
-    print(f"Created:           {meta.created}")
-    print(f"Last Modified:     {meta.modified}")
-    print(f"Last Accessed:     {meta.accessed}")
-    print(f"Mode:              {meta.mode} ({meta.permissions})")
-    print(f"Number of Links:   {meta.n_links}")
-    print(f"Owner UID/Name:    {meta.owner_uid} / {meta.owner_name}")
-    print(f"Group GID/Name:    {meta.group_gid} / {meta.group_name}")
-    print(f"Is File:           {meta.is_file}")
-    print(f"Is Directory:      {meta.is_dir}")
-    print(f"Is Symlink:        {meta.is_symlink}")
-    print(f"MIME Type:         {meta.mime_type}")
-    if meta.sha1_hash is not None:
-        print(f"SHA1 Hash:         {meta.sha1_hash}")
+    out = _METADATA_FMT % (
+        meta.full_path,
+        meta.name,
+        meta.stem,
+        meta.suffix,
+        list(meta.suffixes),
+        meta.parent,
+        meta.size_bytes,
+        datetime.fromtimestamp(meta.created),
+        datetime.fromtimestamp(meta.modified),
+        datetime.fromtimestamp(meta.accessed),
+        meta.mode, meta.permissions,
+        meta.n_links,
+        meta.owner_uid, meta.owner_name,
+        meta.group_gid, meta.group_name,
+        meta.is_file,
+        meta.is_dir,
+        meta.is_symlink,
+        meta.mime_type,
+    )
+    if meta.hash_value is not None:
+        out += "%-19s%s\n" % (meta.hash_algo.upper() + " Hash:", meta.hash_value)
+    sys.stdout.write(out)
 
 def main() -> int:
     """Main entry point."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Display file metadata")
     parser.add_argument("path", help="Full path to the file")
-    parser.add_argument("--sha1", action="store_true", help="Compute SHA1 hash")
+    hash_group = parser.add_mutually_exclusive_group()
+    hash_group.add_argument("--sha1", action="store_true", help="Compute SHA1 hash")
+    hash_group.add_argument(
+        "--algo",
+        choices=HASH_ALGORITHMS,
+        help="Compute the file hash with the given algorithm"
+    )
     args = parser.parse_args()
 
     path = Path(args.path)
@@ -143,7 +537,12 @@ def main() -> int:
             print("Error: Path is not a file.", file=sys.stderr)
             return 1
 
-        meta = get_file_metadata(path, compute_hash=args.sha1)
+        meta = get_file_metadata(
+            path,
+            compute_hash=args.sha1 or args.algo is not None,
+            hash_algo=args.algo or "sha1",
+            resolve=True
+        )
         print_file_metadata(meta)
 
         return 0
@@ -151,6 +550,9 @@ def main() -> int:
     except PermissionError:
         print("Error: Access denied.", file=sys.stderr)
         return 1
+    except ImportError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
     except OSError as e:
         print(f"OS error: {e}", file=sys.stderr)
         return 1
@@ -1,15 +1,321 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import array
+import contextlib
+import functools
+import ctypes
+import ctypes.util
 import subprocess
 import shutil
 import re
-from typing import List, Optional
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional
+
+
+XRANDR_PATH: Optional[str] = shutil.which("xrandr")
+
+_CONNECTED_OUTPUT_RE: re.Pattern[str] = re.compile(
+    r"^(\S+) connected", re.MULTILINE
+)
+_INTERNAL_OUTPUT_RE: re.Pattern[str] = re.compile(r"^(eDP|LVDS)")
+
+# Delay before applying gamma after the last slider movement.
+APPLY_DEBOUNCE_MS: int = 50
+
+# XRandR connection state for a connected output (RR_Connected).
+_RR_CONNECTED: int = 0
+
+
+class _XRRScreenResources(ctypes.Structure):
+    """Mirror of XRRScreenResources from <X11/extensions/Xrandr.h>."""
+    _fields_ = [
+        ("timestamp", ctypes.c_ulong),
+        ("configTimestamp", ctypes.c_ulong),
+        ("ncrtc", ctypes.c_int),
+        ("crtcs", ctypes.POINTER(ctypes.c_ulong)),
+        ("noutput", ctypes.c_int),
+        ("outputs", ctypes.POINTER(ctypes.c_ulong)),
+        ("nmode", ctypes.c_int),
+        ("modes", ctypes.c_void_p),
+    ]
+
+
+class _XRROutputInfo(ctypes.Structure):
+    """Mirror of XRROutputInfo from <X11/extensions/Xrandr.h>."""
+    _fields_ = [
+        ("timestamp", ctypes.c_ulong),
+        ("crtc", ctypes.c_ulong),
+        ("name", ctypes.c_char_p),
+        ("nameLen", ctypes.c_int),
+        ("mm_width", ctypes.c_ulong),
+        ("mm_height", ctypes.c_ulong),
+        ("connection", ctypes.c_ushort),
+        ("subpixel_order", ctypes.c_ushort),
+        ("ncrtc", ctypes.c_int),
+        ("crtcs", ctypes.POINTER(ctypes.c_ulong)),
+        ("nclone", ctypes.c_int),
+        ("clones", ctypes.POINTER(ctypes.c_ulong)),
+        ("nmode", ctypes.c_int),
+        ("npreferred", ctypes.c_int),
+        ("modes", ctypes.POINTER(ctypes.c_ulong)),
+    ]
+
+
+class _XRRCrtcGamma(ctypes.Structure):
+    """Mirror of XRRCrtcGamma from <X11/extensions/Xrandr.h>."""
+    _fields_ = [
+        ("size", ctypes.c_int),
+        ("red", ctypes.POINTER(ctypes.c_ushort)),
+        ("green", ctypes.POINTER(ctypes.c_ushort)),
+        ("blue", ctypes.POINTER(ctypes.c_ushort)),
+    ]
+
+
+class _XErrorEvent(ctypes.Structure):
+    """Mirror of XErrorEvent from <X11/Xlib.h>."""
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("display", ctypes.c_void_p),
+        ("resourceid", ctypes.c_ulong),
+        ("serial", ctypes.c_ulong),
+        ("error_code", ctypes.c_ubyte),
+        ("request_code", ctypes.c_ubyte),
+        ("minor_code", ctypes.c_ubyte),
+    ]
+
+
+# int (*XErrorHandler)(Display *, XErrorEvent *)
+_XErrorHandler = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(_XErrorEvent)
+)
+
+
+def _load_library(name: str) -> ctypes.CDLL:
+    """
+    Load a shared library by its short name (e.g. "X11").
+
+    :param name: Library name without the "lib" prefix or suffix
+    :return: Loaded library handle
+    :raises OSError: If the library cannot be found or loaded
+    """
+    path: Optional[str] = ctypes.util.find_library(name)
+    if path is None:
+        raise OSError(f"lib{name} not found.")
+    return ctypes.CDLL(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Optional[ModuleType]:
+    """
+    Import NumPy on first use so it does not slow down app startup.
+
+    :return: The numpy module, or None if it is not installed
+    """
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional; ramps fall back to pure Python.
+        return None
+    return numpy
+
+
+def gamma_ramp(size: int, gamma: float) -> bytes:
+    """
+    Build a single-channel gamma ramp the same way `xrandr --gamma` does.
+
+    Uses NumPy to vectorize the computation when it is installed.
+
+    :param size: Number of entries in the CRTC gamma table
+    :param gamma: Gamma value for the channel
+    :return: Ramp packed as native-endian unsigned 16-bit values
+    """
+    exponent: float = 1.0 / gamma
+
+    np: Optional[ModuleType] = _numpy()
+    if np is not None:
+        ramp = np.linspace(0.0, 1.0, size) ** exponent * 65535
+        return np.clip(ramp, 0, 65535).astype(np.uint16).tobytes()
+
+    last: int = max(size - 1, 1)
+    return array.array("H", [
+        min(65535, int(65535 * (i / last) ** exponent))
+        for i in range(size)
+    ]).tobytes()
+
+
+class XRandR:
+    """
+    Minimal ctypes binding to libXrandr for listing connected outputs and
+    setting CRTC gamma in-process, without spawning the xrandr binary.
+    """
+
+    def __init__(self) -> None:
+        """
+        Load libX11/libXrandr and open the default X display.
+
+        :raises OSError: If the libraries or the display are unavailable
+        """
+        x11: ctypes.CDLL = _load_library("X11")
+        xrr: ctypes.CDLL = _load_library("Xrandr")
+
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+        x11.XSetErrorHandler.restype = ctypes.c_void_p
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+
+        xrr.XRRGetScreenResourcesCurrent.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong
+        ]
+        xrr.XRRGetScreenResourcesCurrent.restype = ctypes.POINTER(
+            _XRRScreenResources
+        )
+        xrr.XRRFreeScreenResources.argtypes = [
+            ctypes.POINTER(_XRRScreenResources)
+        ]
+        xrr.XRRGetOutputInfo.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(_XRRScreenResources),
+            ctypes.c_ulong
+        ]
+        xrr.XRRGetOutputInfo.restype = ctypes.POINTER(_XRROutputInfo)
+        xrr.XRRFreeOutputInfo.argtypes = [ctypes.POINTER(_XRROutputInfo)]
+        xrr.XRRGetCrtcGammaSize.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        xrr.XRRGetCrtcGammaSize.restype = ctypes.c_int
+        xrr.XRRAllocGamma.argtypes = [ctypes.c_int]
+        xrr.XRRAllocGamma.restype = ctypes.POINTER(_XRRCrtcGamma)
+        xrr.XRRSetCrtcGamma.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XRRCrtcGamma)
+        ]
+        xrr.XRRFreeGamma.argtypes = [ctypes.POINTER(_XRRCrtcGamma)]
+
+        self._x11: ctypes.CDLL = x11
+        self._xrr: ctypes.CDLL = xrr
+        self._x_error_code: int = 0
+        # Kept on the instance so the C callback is not garbage collected.
+        self._error_handler = _XErrorHandler(self._on_x_error)
+        self._display: Optional[int] = x11.XOpenDisplay(None)
+        if not self._display:
+            raise OSError("Cannot open X display.")
+        self._root: int = x11.XDefaultRootWindow(self._display)
+
+    def _on_x_error(self, _display: int, event: "ctypes._Pointer[_XErrorEvent]") -> int:
+        """
+        Record an X protocol error instead of letting Xlib exit the process.
+        """
+        self._x_error_code = event.contents.error_code
+        return 0
+
+    @contextlib.contextmanager
+    def _trap_x_errors(self) -> Iterator[None]:
+        """
+        Turn X protocol errors raised inside the block (e.g. BadRRCrtc for a
+        CRTC that went away after a hotplug) into OSError.
+
+        Xlib's default handler calls exit(), and the handler is process-wide,
+        so ours is only installed for the duration of the block and Tk's is
+        restored afterwards.
+
+        :raises OSError: If the server reported an error for the block
+        """
+        self._x_error_code = 0
+        previous = self._x11.XSetErrorHandler(
+            ctypes.cast(self._error_handler, ctypes.c_void_p)
+        )
+        try:
+            yield
+            self._x11.XSync(self._display, False)
+        finally:
+            self._x11.XSetErrorHandler(previous)
+
+        if self._x_error_code:
+            raise OSError(f"X protocol error {self._x_error_code}.")
+
+    def connected_outputs(self) -> Dict[str, int]:
+        """
+        List connected outputs and the CRTC currently driving each one.
+
+        :return: Mapping of output name to CRTC id (0 if the output is off)
+        :raises OSError: If the screen resources cannot be queried
+        """
+        outputs: Dict[str, int] = {}
+
+        with self._trap_x_errors():
+            res = self._xrr.XRRGetScreenResourcesCurrent(
+                self._display, self._root
+            )
+            if not res:
+                raise OSError("Failed to query XRandR screen resources.")
+
+            try:
+                for i in range(res.contents.noutput):
+                    info = self._xrr.XRRGetOutputInfo(
+                        self._display, res, res.contents.outputs[i]
+                    )
+                    if not info:
+                        continue
+                    try:
+                        if info.contents.connection == _RR_CONNECTED:
+                            name: str = info.contents.name.decode()
+                            outputs[name] = info.contents.crtc
+                    finally:
+                        self._xrr.XRRFreeOutputInfo(info)
+            finally:
+                self._xrr.XRRFreeScreenResources(res)
+
+        return outputs
+
+    def set_gamma(self, crtc: int, red: float, green: float, blue: float) -> None:
+        """
+        Upload RGB gamma ramps to a CRTC.
+
+        :param crtc: CRTC id as returned by connected_outputs()
+        :param red: Red channel gamma
+        :param green: Green channel gamma
+        :param blue: Blue channel gamma
+        :raises OSError: If the CRTC is disabled, stale or has no gamma table
+        """
+        if not crtc:
+            raise OSError("Output is not driven by a CRTC.")
+
+        with self._trap_x_errors():
+            size: int = self._xrr.XRRGetCrtcGammaSize(self._display, crtc)
+            if size <= 0:
+                raise OSError("CRTC does not support gamma adjustment.")
+
+            gamma = self._xrr.XRRAllocGamma(size)
+            if not gamma:
+                raise OSError("Failed to allocate gamma ramp.")
+
+            try:
+                for channel, value in (
+                    (gamma.contents.red, red),
+                    (gamma.contents.green, green),
+                    (gamma.contents.blue, blue),
+                ):
+                    ramp: bytes = gamma_ramp(size, value)
+                    ctypes.memmove(channel, ramp, len(ramp))
+                self._xrr.XRRSetCrtcGamma(self._display, crtc, gamma)
+            finally:
+                self._xrr.XRRFreeGamma(gamma)
+
+    def close(self) -> None:
+        """
+        Close the X display connection.
+        """
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
 
 
 class GammaApp(tk.Tk):
     """
-    Tkinter application that provides RGB gamma control for X11 displays
-    using the `xrandr` command-line tool.
+    Tkinter application that provides RGB gamma control for X11 displays.
+
+    Talks to libXrandr directly when it can be loaded, and falls back to
+    the `xrandr` command-line tool otherwise.
     """
 
     def __init__(self) -> None:
@@ -24,13 +330,20 @@ class GammaApp(tk.Tk):
         self.configure(bg="#1e1e1e")
         self.resizable(False, False)
 
-        if not shutil.which("xrandr"):
-            messagebox.showerror(
-                "Error",
-                "xrandr not found.\nThis app requires X11 and xrandr."
-            )
-            self.destroy()
-            return
+        self.xrandr: Optional[XRandR] = None
+        self.crtcs: Dict[str, int] = {}
+
+        try:
+            self.xrandr = XRandR()
+        except OSError:
+            if XRANDR_PATH is None:
+                messagebox.showerror(
+                    "Error",
+                    "libXrandr and xrandr not found.\n"
+                    "This app requires X11 and XRandR."
+                )
+                self.destroy()
+                return
 
         self.output_name: Optional[str] = self.detect_output()
 
@@ -61,34 +374,42 @@ class GammaApp(tk.Tk):
         self.green: tk.DoubleVar = tk.DoubleVar(value=1.00)
         self.blue: tk.DoubleVar = tk.DoubleVar(value=1.00)
 
+        self._apply_job: Optional[str] = None
+
         if self.output_name is not None:
             self._build_ui()
 
     def detect_output(self) -> Optional[str]:
         """
-        Detect connected display outputs using `xrandr`.
+        Detect connected display outputs using XRandR.
 
         Prefers internal laptop panels (eDP/LVDS) when available.
         Returns the name of the selected output or None if detection fails.
         """
-        try:
-            result: subprocess.CompletedProcess[str] = subprocess.run(
-                ["xrandr"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-        except subprocess.CalledProcessError:
-            messagebox.showerror("Error", "Failed to run xrandr.")
-            self.destroy()
-            return None
-
-        connected: List[str] = []
-
-        for line in result.stdout.splitlines():
-            if " connected" in line:
-                name: str = line.split()[0]
-                connected.append(name)
+        connected: List[str]
+
+        if self.xrandr is not None:
+            try:
+                self.crtcs = self.xrandr.connected_outputs()
+            except OSError:
+                messagebox.showerror("Error", "Failed to query XRandR.")
+                self.destroy()
+                return None
+            connected = list(self.crtcs)
+        else:
+            try:
+                result: subprocess.CompletedProcess[str] = subprocess.run(
+                    [XRANDR_PATH],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+            except subprocess.CalledProcessError:
+                messagebox.showerror("Error", "Failed to run xrandr.")
+                self.destroy()
+                return None
+
+            connected = _CONNECTED_OUTPUT_RE.findall(result.stdout)
 
         if not connected:
             messagebox.showerror(
@@ -99,7 +420,7 @@ class GammaApp(tk.Tk):
             return None
 
         for name in connected:
-            if re.match(r"(eDP|LVDS)", name):
+            if _INTERNAL_OUTPUT_RE.match(name):
                 return name
 
         return connected[0]
@@ -143,23 +464,59 @@ class GammaApp(tk.Tk):
             to=1.0,
             orient="horizontal",
             variable=variable,
-            length=280
+            length=280,
+            command=self._schedule_apply
         )
 
+    def _schedule_apply(self, _value: str) -> None:
+        """
+        Debounce slider movement so a drag results in a single gamma update
+        once the slider has been still for APPLY_DEBOUNCE_MS.
+
+        :param _value: New slider value as passed by ttk.Scale (unused)
+        """
+        if self._apply_job is not None:
+            self.after_cancel(self._apply_job)
+        self._apply_job = self.after(APPLY_DEBOUNCE_MS, self._run_scheduled_apply)
+
+    def _run_scheduled_apply(self) -> None:
+        """
+        Apply gamma for a debounced slider change.
+        """
+        self._apply_job = None
+        self.apply_gamma()
+
     def apply_gamma(self) -> None:
         """
-        Apply the current RGB gamma values to the detected display output
-        using the xrandr command.
+        Apply the current RGB gamma values to the detected display output.
         """
         if self.output_name is None:
             return
 
+        if self.xrandr is not None:
+            try:
+                # CRTC assignments change on hotplug and mode switches, and
+                # an output that was off at launch may have been enabled.
+                self.crtcs = self.xrandr.connected_outputs()
+                self.xrandr.set_gamma(
+                    self.crtcs.get(self.output_name, 0),
+                    self.red.get(),
+                    self.green.get(),
+                    self.blue.get()
+                )
+            except OSError:
+                messagebox.showerror(
+                    "Error",
+                    f"Failed to apply gamma to {self.output_name}."
+                )
+            return
+
         r: str = f"{self.red.get():.2f}"
         g: str = f"{self.green.get():.2f}"
         b: str = f"{self.blue.get():.2f}"
 
         cmd: List[str] = [
-            "xrandr",
+            XRANDR_PATH,
             "--output", self.output_name,
             "--gamma", f"{r}:{g}:{b}"
         ]
@@ -172,6 +529,21 @@ class GammaApp(tk.Tk):
                 f"Failed to apply gamma to {self.output_name}."
             )
 
+    def destroy(self) -> None:
+        """
+        Release the X display connection and destroy the window.
+        """
+        job: Optional[str] = getattr(self, "_apply_job", None)
+        if job is not None:
+            self.after_cancel(job)
+            self._apply_job = None
+
+        xrandr: Optional[XRandR] = getattr(self, "xrandr", None)
+        if xrandr is not None:
+            xrandr.close()
+            self.xrandr = None
+        super().destroy()
+
 
 if __name__ == "__main__":
     app: GammaApp = GammaApp()